@@ -302,7 +302,7 @@ class TestBoltPCSClient(unittest.IsolatedAsyncioTestCase):
             num_mpc_containers=self.test_num_containers,
             num_files_per_mpc_container=NUM_NEW_SHARDS_PER_FILE,
             status_updates=[],
-            pcs_features=features,
+            pcs_features=PCSFeature.to_bitmask(features),
             ca_certificate="test_cert",
         )
         common: CommonProductConfig = CommonProductConfig(
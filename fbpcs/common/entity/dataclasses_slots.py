@@ -0,0 +1,83 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+from dataclasses import fields, FrozenInstanceError, is_dataclass
+from itertools import chain
+from typing import Any, Callable, Dict, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+
+def _frozen_getstate(self: Any) -> Tuple[Any, ...]:
+    return tuple(getattr(self, f.name) for f in fields(self))
+
+
+def _frozen_setstate(self: Any, state: Tuple[Any, ...]) -> None:
+    # frozen dataclasses reject setattr, so bypass it the same way __init__ does
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
+
+
+def _frozen_setattr(cls: Type[Any]) -> Callable[[Any, str, Any], None]:
+    # the __setattr__ generated by @dataclass closes over the original class, which
+    # makes its super() call fail once the class is rebuilt
+    def __setattr__(self: Any, name: str, value: Any) -> None:
+        if type(self) is cls or name in {f.name for f in fields(cls)}:
+            raise FrozenInstanceError(f"cannot assign to field {name!r}")
+        super(cls, self).__setattr__(name, value)
+
+    return __setattr__
+
+
+def _frozen_delattr(cls: Type[Any]) -> Callable[[Any, str], None]:
+    def __delattr__(self: Any, name: str) -> None:
+        if type(self) is cls or name in {f.name for f in fields(cls)}:
+            raise FrozenInstanceError(f"cannot delete field {name!r}")
+        super(cls, self).__delattr__(name)
+
+    return __delattr__
+
+
+def dataclass_slots(cls: Type[T]) -> Type[T]:
+    """Rebuilds a dataclass so that its instances use __slots__ instead of a __dict__
+
+    This is a backport of dataclass(slots=True), which requires python 3.10. Apply it
+    directly on top of @dataclass. Slots only pay off when every base class is slotted
+    too, so it is meant for small value classes that don't inherit from mixins. Fields
+    already slotted by a base class are not slotted again.
+    """
+    if not is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} is not a dataclass")
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} already specifies __slots__")
+
+    cls_dict: Dict[str, Any] = dict(cls.__dict__)
+    inherited_slots = set(
+        chain.from_iterable(
+            getattr(base, "__slots__", ()) for base in cls.__mro__[1:-1]
+        )
+    )
+    field_names = tuple(f.name for f in fields(cls) if f.name not in inherited_slots)
+    cls_dict["__slots__"] = field_names
+    # field defaults are class attributes, which would clash with the slots;
+    # the generated __init__ already carries them.
+    for f in fields(cls):
+        cls_dict.pop(f.name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    # pyre-ignore[16]: set by @dataclass
+    frozen = cls.__dataclass_params__.frozen
+    if frozen and "__getstate__" not in cls_dict:
+        cls_dict["__getstate__"] = _frozen_getstate
+        cls_dict["__setstate__"] = _frozen_setstate
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    if frozen:
+        slotted_cls.__setattr__ = _frozen_setattr(slotted_cls)
+        slotted_cls.__delattr__ = _frozen_delattr(slotted_cls)
+    return slotted_cls
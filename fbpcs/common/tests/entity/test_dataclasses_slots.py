@@ -0,0 +1,75 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+import pickle
+import unittest
+from dataclasses import dataclass, FrozenInstanceError
+
+from dataclasses_json import dataclass_json
+from fbpcs.common.entity.dataclasses_slots import dataclass_slots
+
+
+@dataclass_json
+@dataclass_slots
+@dataclass
+class SlottedPoint:
+    x: int
+    y: int = 0
+
+
+@dataclass_slots
+@dataclass(frozen=True)
+class FrozenSlottedPoint:
+    x: int
+    y: int = 0
+
+
+@dataclass_slots
+@dataclass(frozen=True)
+class FrozenSlottedPoint3D(FrozenSlottedPoint):
+    z: int = 0
+
+
+class TestDataclassSlots(unittest.TestCase):
+    def test_instances_have_no_dict(self) -> None:
+        point = SlottedPoint(1)
+
+        self.assertEqual(("x", "y"), SlottedPoint.__slots__)
+        self.assertFalse(hasattr(point, "__dict__"))
+        with self.assertRaises(AttributeError):
+            # pyre-ignore[16]: testing that unknown attributes are rejected
+            point.z = 2
+
+    def test_dataclass_behavior_is_kept(self) -> None:
+        point = SlottedPoint(1)
+
+        self.assertEqual(0, point.y)
+        self.assertEqual(SlottedPoint(1, 0), point)
+        self.assertEqual("SlottedPoint(x=1, y=0)", repr(point))
+        self.assertEqual(point, pickle.loads(pickle.dumps(point)))
+        # pyre-ignore[16]: added by dataclass_json
+        self.assertEqual(point, SlottedPoint.from_json(point.to_json()))
+        # pyre-ignore[16]: added by dataclass_json
+        self.assertEqual(point, SlottedPoint.schema().loads('{"x": 1}'))
+
+    def test_frozen_subclass(self) -> None:
+        point = FrozenSlottedPoint3D(1, 2, 3)
+
+        self.assertEqual(("z",), FrozenSlottedPoint3D.__slots__)
+        self.assertFalse(hasattr(point, "__dict__"))
+        self.assertEqual(hash(FrozenSlottedPoint3D(1, 2, 3)), hash(point))
+        self.assertEqual(point, pickle.loads(pickle.dumps(point)))
+        with self.assertRaises(FrozenInstanceError):
+            # pyre-ignore[41]: testing that frozen fields are rejected
+            point.x = 2
+
+    def test_rejects_non_dataclass(self) -> None:
+        class NotADataclass:
+            pass
+
+        with self.assertRaises(TypeError):
+            dataclass_slots(NotADataclass)
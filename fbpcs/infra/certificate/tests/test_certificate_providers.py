@@ -70,7 +70,7 @@ class TestCertificateProviders(unittest.TestCase):
             num_files_per_mpc_container=4,
             status_updates=[],
             run_id="681ba82c-16d9-11ed-861d-0242ac120002",
-            pcs_features={PCSFeature.PCF_TLS},
+            pcs_features=PCSFeature.to_bitmask({PCSFeature.PCF_TLS}),
             server_certificate=self.test_server_cert_content,
             ca_certificate=self.test_ca_cert_content,
         )
@@ -5,10 +5,21 @@
 
 # pyre-unsafe
 
+import sys
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Set, Type, TYPE_CHECKING, Union
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    TYPE_CHECKING,
+    Union,
+)
 
 from dataclasses_json import config, dataclass_json, DataClassJsonMixin
 
@@ -27,6 +38,7 @@ from fbpcs.common.entity.dataclasses_mutability import (
     immutable_field,
     MutabilityMetadata,
 )
+from fbpcs.common.entity.dataclasses_slots import dataclass_slots
 from fbpcs.common.entity.frozen_field_hook import FrozenFieldHook
 from fbpcs.common.entity.stage_state_instance import StageStateInstance
 from fbpcs.common.entity.update_generic_hook import UpdateGenericHook
@@ -39,7 +51,6 @@ from fbpcs.private_computation.entity.private_computation_status import (
     PrivateComputationInstanceStatus,
 )
 from marshmallow import fields
-from marshmallow_enum import EnumField
 
 
 class PrivateComputationRole(Enum):
@@ -54,15 +65,16 @@ class PrivateComputationGameType(Enum):
     ANONYMIZER = "ANONYMIZER"
 
 
-TLS_SUPPORTED_GAME_TYPES: Set[PrivateComputationGameType] = {
-    PrivateComputationGameType.LIFT
-}
+TLS_SUPPORTED_GAME_TYPES: FrozenSet[PrivateComputationGameType] = frozenset(
+    {PrivateComputationGameType.LIFT}
+)
 
 
 UnionedPCInstance = Union[PostProcessingInstance, StageStateInstance]
 
 
 @dataclass_json
+@dataclass_slots
 @dataclass
 class StatusUpdate:
     status: PrivateComputationInstanceStatus
@@ -73,10 +85,12 @@ class StatusUpdate:
 # called in post_status_hook
 # happens whenever status is updated
 def post_update_status(obj: "InfraConfig") -> None:
-    obj.status_update_ts = int(time.time())
+    # read the clock once so end_ts matches the final status update exactly
+    now = int(time.time())
+    obj.status_update_ts = now
     append_status_updates(obj)
     if obj.is_stage_flow_completed():
-        obj.end_ts = int(time.time())
+        obj.end_ts = now
 
 
 # called in post_status_hook
@@ -100,6 +114,16 @@ post_status_hook: UpdateGenericHook["InfraConfig"] = UpdateGenericHook(
 )
 
 
+# pcs_features is held as a PCSFeature bitmask but serialized as a list of
+# feature values, which keeps the json format of existing instances
+def encode_pcs_features(pcs_features: int) -> List[str]:
+    return [feature.value for feature in PCSFeature.from_bitmask(pcs_features)]
+
+
+def decode_pcs_features(feature_values: Iterable[str]) -> int:
+    return PCSFeature.to_bitmask(PCSFeature(value) for value in feature_values)
+
+
 # create FrozenFieldHook: set end_ts immutable after initialized
 set_end_ts_immutable_hook: FrozenFieldHook = FrozenFieldHook(
     other_field="end_ts",
@@ -107,6 +131,24 @@ set_end_ts_immutable_hook: FrozenFieldHook = FrozenFieldHook(
 )
 
 
+# InfraConfig field metadata, merged once here instead of in the class body
+_STATUS_METADATA: Dict[str, Any] = DataclassHookMixin.get_metadata(post_status_hook)
+_END_TS_METADATA: Dict[str, Any] = DataclassHookMixin.get_metadata(
+    set_end_ts_immutable_hook
+)
+_PCS_FEATURES_METADATA: Dict[str, Any] = {
+    **config(
+        encoder=encode_pcs_features,
+        decoder=decode_pcs_features,
+        mm_field=fields.Function(
+            serialize=lambda obj: encode_pcs_features(obj.pcs_features),
+            deserialize=decode_pcs_features,
+        ),
+    ),
+    **MutabilityMetadata.IMMUTABLE.value,
+}
+
+
 @dataclass
 class InfraConfig(DataClassJsonMixin, DataclassMutabilityMixin):
     """Stores metadata of infra config in a private computation instance
@@ -124,6 +166,7 @@ class InfraConfig(DataClassJsonMixin, DataclassMutabilityMixin):
         num_files_per_mpc_container: the number of files for each container
         fbpcs_bundle_id: an string indicating the fbpcs bundle id to run.
         tier: an string indicating the release binary tier to run (rc, canary, latest)
+        pcs_features: a bitmask of the enabled PCSFeatures (see PCSFeature.to_bitmask)
         retry_counter: the number times a stage has been retried
         creation_ts: the time of the creation of this PrivateComputationInstance
         end_ts: the time of the the end when finishing a computation run
@@ -138,9 +181,7 @@ class InfraConfig(DataClassJsonMixin, DataclassMutabilityMixin):
 
     instance_id: str = immutable_field()
     role: PrivateComputationRole = immutable_field()
-    status: PrivateComputationInstanceStatus = field(
-        metadata=DataclassHookMixin.get_metadata(post_status_hook)
-    )
+    status: PrivateComputationInstanceStatus = field(metadata=_STATUS_METADATA)
     status_update_ts: int
     instances: List[UnionedPCInstance]
     game_type: PrivateComputationGameType = immutable_field()
@@ -154,14 +195,7 @@ class InfraConfig(DataClassJsonMixin, DataclassMutabilityMixin):
 
     fbpcs_bundle_id: Optional[str] = immutable_field(init=False)
     tier: Optional[str] = immutable_field(default=None)
-    pcs_features: Set[PCSFeature] = field(
-        default_factory=set,
-        metadata={
-            # this makes type warning away when serialize this field
-            **config(mm_field=fields.List(EnumField(enum=PCSFeature, by_value=True))),
-            **MutabilityMetadata.IMMUTABLE.value,
-        },
-    )
+    pcs_features: int = field(default=0, metadata=_PCS_FEATURES_METADATA)
     pce_config: Optional[PCEConfig] = None
     run_id: Optional[str] = immutable_field(default=None)
     log_cost_bucket: Optional[str] = immutable_field(default=None)
@@ -173,9 +207,7 @@ class InfraConfig(DataClassJsonMixin, DataclassMutabilityMixin):
     retry_counter: int = 0
     creation_ts: int = immutable_field(default_factory=lambda: int(time.time()))
 
-    end_ts: int = field(
-        default=0, metadata=DataclassHookMixin.get_metadata(set_end_ts_immutable_hook)
-    )
+    end_ts: int = field(default=0, metadata=_END_TS_METADATA)
 
     # TODO: concurrency should be immutable eventually
     mpc_compute_concurrency: int = 1
@@ -205,15 +237,23 @@ class InfraConfig(DataClassJsonMixin, DataclassMutabilityMixin):
     @property
     def is_tls_enabled(self) -> bool:
         """Returns true if the TLS feature is enabled; otherwise, false."""
-        return (
-            PCSFeature.PCF_TLS in self.pcs_features
-            and self.game_type in TLS_SUPPORTED_GAME_TYPES
+        # LIFT is the common case, so check it by identity before the set lookup
+        return self.has_feature(PCSFeature.PCF_TLS) and (
+            self.game_type is PrivateComputationGameType.LIFT
+            or self.game_type in TLS_SUPPORTED_GAME_TYPES
         )
 
+    def has_feature(self, feature: PCSFeature) -> bool:
+        return bool(self.pcs_features & feature.bitmask)
+
     def is_stage_flow_completed(self) -> bool:
         return self.status is self.stage_flow.get_last_stage().completed_status
 
     def __post_init__(self):
+        # stage flow class names are interned by the interpreter, so interning the
+        # (usually deserialized) name lets cls_name_to_cls match it by identity.
+        # This has to happen before super().__post_init__ makes the field immutable.
+        self._stage_flow_cls_name = sys.intern(self._stage_flow_cls_name)
         # ensure mutability before override __post_init__
         super().__post_init__()
         # note: The reason can't make it fbpcs_bundle_id = immutable_field(default=os.getenv(FBPCS_BUNDLE_ID)),
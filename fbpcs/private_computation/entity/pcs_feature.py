@@ -8,6 +8,7 @@
 
 import logging
 from enum import Enum
+from typing import Dict, Iterable, List
 
 
 class PCSFeature(Enum):
@@ -65,3 +66,32 @@ class PCSFeature(Enum):
         except ValueError:
             logging.warning(f"can't map {feature_str} to pre-defined PCSFeature")
             return PCSFeature.UNKNOWN
+
+    @property
+    def bitmask(self) -> int:
+        """the single bit representing this feature in a pcs_features bitmask"""
+        return _PCS_FEATURE_BITMASKS[self]
+
+    @staticmethod
+    def to_bitmask(features: Iterable["PCSFeature"]) -> int:
+        """folds a collection of features into a pcs_features bitmask"""
+        bitmask = 0
+        for feature in features:
+            bitmask |= _PCS_FEATURE_BITMASKS[feature]
+        return bitmask
+
+    @staticmethod
+    def from_bitmask(bitmask: int) -> List["PCSFeature"]:
+        """expands a pcs_features bitmask into features, in definition order"""
+        return [
+            feature
+            for feature, feature_bit in _PCS_FEATURE_BITMASKS.items()
+            if bitmask & feature_bit
+        ]
+
+
+# The bits only live in memory: pcs_features is always serialized as a list of
+# feature values, so adding or reordering members never breaks stored instances.
+_PCS_FEATURE_BITMASKS: Dict[PCSFeature, int] = {
+    feature: 1 << i for i, feature in enumerate(PCSFeature)
+}
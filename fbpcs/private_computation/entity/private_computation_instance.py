@@ -69,13 +69,15 @@ class PrivateComputationInstance(InstanceBase):
     product_config: ProductConfig
 
     def dumps_schema(self) -> str:
-        json_object = json.loads(super().dumps_schema())
+        # dump to plain dicts and encode once, instead of a dumps/loads round trip per part
+        # pyre-ignore[16] Undefined attribute
+        json_object = self.schema().dump(self)
 
         # this is a helper field used in InstanceBase setter
         json_object.pop("initialized", None)
 
-        json_object["product_config"] = json.loads(
-            self.product_config.__class__.schema().dumps(self.product_config)
+        json_object["product_config"] = self.product_config.__class__.schema().dump(
+            self.product_config
         )
         return json.dumps(json_object)
 
@@ -84,8 +86,8 @@ class PrivateComputationInstance(InstanceBase):
         json_object = json.loads(json_schema_str)
 
         # create infra config
-        infra_config: InfraConfig = InfraConfig.schema().loads(
-            json.dumps(json_object["infra_config"]),
+        infra_config: InfraConfig = InfraConfig.schema().load(
+            json_object["infra_config"],
             unknown=marshmallow.utils.EXCLUDE,
             many=None,
         )
@@ -99,8 +101,8 @@ class PrivateComputationInstance(InstanceBase):
             # delete json contents which are not in config class
             # this makes old PCInstance still valid when deleting attributes
             try:
-                product_config = cls._product_map(json_object).loads(
-                    json.dumps(product_json),
+                product_config = cls._product_map(json_object).load(
+                    product_json,
                     unknown=marshmallow.utils.EXCLUDE,
                     many=None,
                 )
@@ -387,13 +389,18 @@ class PrivateComputationInstance(InstanceBase):
             )
             return False
 
-        return feature in self.infra_config.pcs_features
+        return self.infra_config.has_feature(feature)
 
     @property
     def feature_flags(self) -> Optional[str]:
         if self.infra_config.pcs_features:
             return ",".join(
-                [feature.value for feature in self.infra_config.pcs_features]
+                [
+                    feature.value
+                    for feature in PCSFeature.from_bitmask(
+                        self.infra_config.pcs_features
+                    )
+                ]
             )
 
         return None
@@ -9,7 +9,9 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, TypedDict
+from typing import Dict, Tuple, TypedDict
+
+from fbpcs.common.entity.dataclasses_slots import dataclass_slots
 
 from fbpcs.onedocker_binary_names import OneDockerBinaryNames
 
@@ -37,7 +39,8 @@ class GameNames(Enum):
     PRIVATE_ID_DFCA_AGGREGATION = "private_id_dfca_aggregation"
 
 
-@dataclass
+@dataclass_slots
+@dataclass(frozen=True)
 class OneDockerArgument:
     name: str
     required: bool
@@ -45,13 +48,13 @@ class OneDockerArgument:
 
 class GameNamesValue(TypedDict):
     onedocker_package_name: str
-    arguments: List[OneDockerArgument]
+    arguments: Tuple[OneDockerArgument, ...]
 
 
 PRIVATE_COMPUTATION_GAME_CONFIG: Dict[str, GameNamesValue] = {
     GameNames.LIFT.value: {
         "onedocker_package_name": OneDockerBinaryNames.LIFT_COMPUTE.value,
-        "arguments": [
+        "arguments": (
             OneDockerArgument(name="input_base_path", required=True),
             OneDockerArgument(name="output_base_path", required=True),
             OneDockerArgument(name="file_start_index", required=False),
@@ -59,11 +62,11 @@ PRIVATE_COMPUTATION_GAME_CONFIG: Dict[str, GameNamesValue] = {
             OneDockerArgument(name="concurrency", required=True),
             OneDockerArgument(name="run_id", required=False),
             OneDockerArgument(name="pc_feature_flags", required=False),
-        ],
+        ),
     },
     GameNames.PCF2_LIFT.value: {
         "onedocker_package_name": OneDockerBinaryNames.PCF2_LIFT.value,
-        "arguments": [
+        "arguments": (
             OneDockerArgument(name="input_base_path", required=True),
             OneDockerArgument(name="output_base_path", required=True),
             OneDockerArgument(name="input_global_params_path", required=False),
@@ -83,11 +86,11 @@ PRIVATE_COMPUTATION_GAME_CONFIG: Dict[str, GameNamesValue] = {
             OneDockerArgument(name="ca_cert_path", required=False),
             OneDockerArgument(name="server_cert_path", required=False),
             OneDockerArgument(name="private_key_path", required=False),
-        ],
+        ),
     },
     GameNames.PCF2_LIFT_METADATA_COMPACTION.value: {
         "onedocker_package_name": OneDockerBinaryNames.PCF2_LIFT_METADATA_COMPACTION.value,
-        "arguments": [
+        "arguments": (
             OneDockerArgument(name="input_path", required=False),
             OneDockerArgument(name="output_global_params_path", required=False),
             OneDockerArgument(name="output_secret_shares_path", required=False),
@@ -109,11 +112,11 @@ PRIVATE_COMPUTATION_GAME_CONFIG: Dict[str, GameNamesValue] = {
             OneDockerArgument(name="ca_cert_path", required=False),
             OneDockerArgument(name="server_cert_path", required=False),
             OneDockerArgument(name="private_key_path", required=False),
-        ],
+        ),
     },
     GameNames.SECURE_RANDOM_SHARDER.value: {
         "onedocker_package_name": OneDockerBinaryNames.SECURE_RANDOM_SHARDER.value,
-        "arguments": [
+        "arguments": (
             OneDockerArgument(name="input_filename", required=True),
             OneDockerArgument(name="output_filenames", required=False),
             OneDockerArgument(name="output_base_path", required=True),
@@ -125,11 +128,11 @@ PRIVATE_COMPUTATION_GAME_CONFIG: Dict[str, GameNamesValue] = {
             OneDockerArgument(name="ca_cert_path", required=False),
             OneDockerArgument(name="server_cert_path", required=False),
             OneDockerArgument(name="private_key_path", required=False),
-        ],
+        ),
     },
     GameNames.SHARD_AGGREGATOR.value: {
         "onedocker_package_name": OneDockerBinaryNames.SHARD_AGGREGATOR.value,
-        "arguments": [
+        "arguments": (
             OneDockerArgument(name="input_base_path", required=True),
             OneDockerArgument(name="num_shards", required=True),
             OneDockerArgument(name="output_path", required=True),
@@ -143,11 +146,11 @@ PRIVATE_COMPUTATION_GAME_CONFIG: Dict[str, GameNamesValue] = {
             OneDockerArgument(name="visibility", required=False),
             OneDockerArgument(name="run_id", required=False),
             OneDockerArgument(name="pc_feature_flags", required=False),
-        ],
+        ),
     },
     GameNames.PCF2_SHARD_COMBINER.value: {
         "onedocker_package_name": OneDockerBinaryNames.PCF2_SHARD_COMBINER.value,
-        "arguments": [
+        "arguments": (
             OneDockerArgument(name="input_base_path", required=True),
             OneDockerArgument(name="num_shards", required=True),
             OneDockerArgument(name="output_path", required=True),
@@ -165,11 +168,11 @@ PRIVATE_COMPUTATION_GAME_CONFIG: Dict[str, GameNamesValue] = {
             OneDockerArgument(name="private_key_path", required=False),
             OneDockerArgument(name="run_id", required=False),
             OneDockerArgument(name="pc_feature_flags", required=False),
-        ],
+        ),
     },
     GameNames.DECOUPLED_ATTRIBUTION.value: {
         "onedocker_package_name": OneDockerBinaryNames.DECOUPLED_ATTRIBUTION.value,
-        "arguments": [
+        "arguments": (
             OneDockerArgument(name="input_base_path", required=True),
             OneDockerArgument(name="output_base_path", required=True),
             OneDockerArgument(name="attribution_rules", required=True),
@@ -183,11 +186,11 @@ PRIVATE_COMPUTATION_GAME_CONFIG: Dict[str, GameNamesValue] = {
             OneDockerArgument(name="run_name", required=False),
             OneDockerArgument(name="max_num_touchpoints", required=False),
             OneDockerArgument(name="max_num_conversions", required=False),
-        ],
+        ),
     },
     GameNames.DECOUPLED_AGGREGATION.value: {
         "onedocker_package_name": OneDockerBinaryNames.DECOUPLED_AGGREGATION.value,
-        "arguments": [
+        "arguments": (
             OneDockerArgument(name="aggregators", required=True),
             OneDockerArgument(name="input_base_path", required=True),
             OneDockerArgument(name="input_base_path_secret_share", required=True),
@@ -202,11 +205,11 @@ PRIVATE_COMPUTATION_GAME_CONFIG: Dict[str, GameNamesValue] = {
             OneDockerArgument(name="run_name", required=False),
             OneDockerArgument(name="max_num_touchpoints", required=False),
             OneDockerArgument(name="max_num_conversions", required=False),
-        ],
+        ),
     },
     GameNames.PCF2_ATTRIBUTION.value: {
         "onedocker_package_name": OneDockerBinaryNames.PCF2_ATTRIBUTION.value,
-        "arguments": [
+        "arguments": (
             OneDockerArgument(name="input_base_path", required=True),
             OneDockerArgument(name="output_base_path", required=True),
             OneDockerArgument(name="attribution_rules", required=True),
@@ -229,11 +232,11 @@ PRIVATE_COMPUTATION_GAME_CONFIG: Dict[str, GameNamesValue] = {
             OneDockerArgument(name="private_key_path", required=False),
             OneDockerArgument(name="max_num_touchpoints", required=False),
             OneDockerArgument(name="max_num_conversions", required=False),
-        ],
+        ),
     },
     GameNames.PCF2_AGGREGATION.value: {
         "onedocker_package_name": OneDockerBinaryNames.PCF2_AGGREGATION.value,
-        "arguments": [
+        "arguments": (
             OneDockerArgument(name="aggregators", required=True),
             OneDockerArgument(name="input_base_path", required=True),
             OneDockerArgument(name="input_base_path_secret_share", required=True),
@@ -257,11 +260,11 @@ PRIVATE_COMPUTATION_GAME_CONFIG: Dict[str, GameNamesValue] = {
             OneDockerArgument(name="private_key_path", required=False),
             OneDockerArgument(name="max_num_touchpoints", required=False),
             OneDockerArgument(name="max_num_conversions", required=False),
-        ],
+        ),
     },
     GameNames.PRIVATE_ID_DFCA_AGGREGATION.value: {
         "onedocker_package_name": OneDockerBinaryNames.PRIVATE_ID_DFCA_AGGREGATOR.value,
-        "arguments": [
+        "arguments": (
             OneDockerArgument(name="input_path", required=True),
             OneDockerArgument(name="output_path", required=True),
             OneDockerArgument(name="log_cost_s3_bucket", required=False),
@@ -270,29 +273,39 @@ PRIVATE_COMPUTATION_GAME_CONFIG: Dict[str, GameNamesValue] = {
             OneDockerArgument(name="run_name", required=False),
             OneDockerArgument(name="run_id", required=False),
             OneDockerArgument(name="pc_feature_flags", required=False),
-        ],
+        ),
     },
 }
 
 
+def _build_game_config(name: str, game_config: GameNamesValue) -> MPCGameConfig:
+    return MPCGameConfig(
+        game_name=name,
+        onedocker_package_name=game_config["onedocker_package_name"],
+        arguments=[
+            MPCGameArgument(name=argument.name, required=argument.required)
+            for argument in game_config["arguments"]
+        ],
+    )
+
+
 class PrivateComputationGameRepository(MPCGameRepository):
     def __init__(self) -> None:
         self.private_computation_game_config: Dict[str, GameNamesValue] = (
             PRIVATE_COMPUTATION_GAME_CONFIG
         )
+        # the game table is static, so each MPCGameConfig is built the first time
+        # the game is requested and reused afterwards
+        self._game_configs: Dict[str, MPCGameConfig] = {}
 
     def get_game(self, name: str) -> MPCGameConfig:
-        if name not in self.private_computation_game_config:
-            raise ValueError(f"Game {name} is not supported.")
+        game_config = self._game_configs.get(name)
+        if game_config is None:
+            if name not in self.private_computation_game_config:
+                raise ValueError(f"Game {name} is not supported.")
+            game_config = _build_game_config(
+                name, self.private_computation_game_config[name]
+            )
+            self._game_configs[name] = game_config
 
-        game_config = self.private_computation_game_config[name]
-        arguments: List[MPCGameArgument] = [
-            MPCGameArgument(name=argument.name, required=argument.required)
-            for argument in game_config["arguments"]
-        ]
-
-        return MPCGameConfig(
-            game_name=name,
-            onedocker_package_name=game_config["onedocker_package_name"],
-            arguments=arguments,
-        )
+        return game_config
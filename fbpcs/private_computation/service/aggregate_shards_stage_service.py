@@ -7,7 +7,7 @@
 # pyre-strict
 
 import logging
-from typing import Any, DefaultDict, Dict, List, Optional
+from typing import Any, DefaultDict, Dict, FrozenSet, List, Optional
 
 from fbpcs.common.entity.stage_state_instance import StageStateInstance
 from fbpcs.infra.certificate.certificate_provider import CertificateProvider
@@ -45,6 +45,30 @@ from fbpcs.private_computation.service.utils import (
     stop_stage_service,
 )
 
+# TODO T101225989: map aggregation_type from the compute stage to metrics_format_type
+METRICS_FORMAT_TYPES: Dict[PrivateComputationGameType, str] = {
+    PrivateComputationGameType.LIFT: "lift",
+}
+DEFAULT_METRICS_FORMAT_TYPE: str = "ad_object"
+
+# stage flows whose shards are read from the PCF2 aggregation / PCF2 lift stage output
+PCF2_AGGREGATION_STAGE_FLOWS: FrozenSet[str] = frozenset(
+    {
+        "PrivateComputationPCF2StageFlow",
+        "PrivateComputationMRStageFlow",
+        "PrivateComputationPCF2LocalTestStageFlow",
+        "PrivateComputationPIDPATestStageFlow",
+    }
+)
+PCF2_LIFT_STAGE_FLOWS: FrozenSet[str] = frozenset(
+    {
+        "PrivateComputationPCF2LiftStageFlow",
+        "PrivateComputationPCF2LiftUDPStageFlow",
+        "PrivateComputationPCF2LiftLocalTestStageFlow",
+        "PrivateComputationMrPidPCF2LiftStageFlow",
+    }
+)
+
 
 class AggregateShardsStageService(PrivateComputationStageService):
     """Handles business logic for the private computation aggregate metrics stage
@@ -96,6 +120,7 @@ class AggregateShardsStageService(PrivateComputationStageService):
         """
         binary_name = self.get_onedocker_binary_name(pc_instance)
         binary_config = self._onedocker_binary_config_map[binary_name]
+        game_name = self.get_game_name(pc_instance)
 
         # Create and start MPC instance
         game_args = self.get_game_args(
@@ -106,7 +131,7 @@ class AggregateShardsStageService(PrivateComputationStageService):
         )
 
         _, cmd_args_list = self._mpc_service.convert_cmd_args_list(
-            game_name=self.get_game_name(pc_instance),
+            game_name=game_name,
             game_args=game_args,
             mpc_party=map_private_computation_role_to_mpc_party(
                 pc_instance.infra_config.role
@@ -158,9 +183,7 @@ class AggregateShardsStageService(PrivateComputationStageService):
             server_uris=server_uris,
         )
         pc_instance.infra_config.instances.append(stage_state)
-        logging.info(
-            f"MPC instance started running for game {self.get_game_name(pc_instance)}"
-        )
+        logging.info(f"MPC instance started running for game {game_name}")
         return pc_instance
 
     def get_game_args(
@@ -169,84 +192,68 @@ class AggregateShardsStageService(PrivateComputationStageService):
         server_certificate_path: str,
         ca_certificate_path: str,
     ) -> List[Dict[str, Any]]:
+        infra_config = pc_instance.infra_config
+        product_config = pc_instance.product_config
         if pc_instance.has_feature(PCSFeature.PRIVATE_LIFT_UNIFIED_DATA_PROCESS):
-            num_shards = pc_instance.infra_config.num_secure_random_shards
+            num_shards = infra_config.num_secure_random_shards
         else:
             num_shards = (
-                pc_instance.infra_config.num_mpc_containers
-                * pc_instance.infra_config.num_files_per_mpc_container
+                infra_config.num_mpc_containers
+                * infra_config.num_files_per_mpc_container
             )
 
-        # TODO T101225989: map aggregation_type from the compute stage to metrics_format_type
-        metrics_format_type = (
-            "lift"
-            if pc_instance.infra_config.game_type is PrivateComputationGameType.LIFT
-            else "ad_object"
+        metrics_format_type = METRICS_FORMAT_TYPES.get(
+            infra_config.game_type, DEFAULT_METRICS_FORMAT_TYPE
         )
 
         if self._log_cost_to_s3:
-            run_name = pc_instance.infra_config.instance_id
+            run_name = infra_config.instance_id
             log_name = (
                 "sc-logs"
                 if pc_instance.has_feature(PCSFeature.SHARD_COMBINER_PCF2_RELEASE)
                 else "sa-logs"
             )
-            if pc_instance.product_config.common.post_processing_data:
-                pc_instance.product_config.common.post_processing_data.s3_cost_export_output_paths.add(
-                    f"{log_name}/{run_name}_{pc_instance.infra_config.role.value.title()}.json",
+            if product_config.common.post_processing_data:
+                product_config.common.post_processing_data.s3_cost_export_output_paths.add(
+                    f"{log_name}/{run_name}_{infra_config.role.value.title()}.json",
                 )
         else:
             run_name = ""
 
-        game_args = [
-            {
-                "input_base_path": self.get_input_stage_path(pc_instance),
-                "metrics_format_type": metrics_format_type,
-                "num_shards": num_shards,
-                "output_path": self.get_output_path(pc_instance),
-                "threshold": (
-                    0
-                    if isinstance(pc_instance.product_config, AttributionConfig)
-                    # pyre-ignore Undefined attribute [16]
-                    else pc_instance.product_config.k_anonymity_threshold
-                ),
-                "run_name": run_name,
-                "log_cost": self._log_cost_to_s3,
-                "log_cost_s3_bucket": pc_instance.infra_config.log_cost_bucket,
-                "run_id": pc_instance.infra_config.run_id,
-            },
-        ]
-        if pc_instance.feature_flags is not None:
-            for arg in game_args:
-                arg["pc_feature_flags"] = pc_instance.feature_flags
+        game_arg: Dict[str, Any] = {
+            "input_base_path": self.get_input_stage_path(pc_instance),
+            "metrics_format_type": metrics_format_type,
+            "num_shards": num_shards,
+            "output_path": self.get_output_path(pc_instance),
+            "threshold": (
+                0
+                if isinstance(product_config, AttributionConfig)
+                # pyre-ignore Undefined attribute [16]
+                else product_config.k_anonymity_threshold
+            ),
+            "run_name": run_name,
+            "log_cost": self._log_cost_to_s3,
+            "log_cost_s3_bucket": infra_config.log_cost_bucket,
+            "run_id": infra_config.run_id,
+        }
+        feature_flags = pc_instance.feature_flags
+        if feature_flags is not None:
+            game_arg["pc_feature_flags"] = feature_flags
 
         # We should only export visibility to scribe when it's set
-        if (
-            pc_instance.product_config.common.result_visibility
-            is not ResultVisibility.PUBLIC
-        ):
-            result_visibility = int(pc_instance.product_config.common.result_visibility)
-            for arg in game_args:
-                arg["visibility"] = result_visibility
+        result_visibility = product_config.common.result_visibility
+        if result_visibility is not ResultVisibility.PUBLIC:
+            game_arg["visibility"] = int(result_visibility)
 
-        return game_args
+        return [game_arg]
 
     @classmethod
     def get_input_stage_path(cls, pc_instance: PrivateComputationInstance) -> str:
         # Get output path of previous stage depending on what stage flow we are using
-        if pc_instance.get_flow_cls_name in [
-            "PrivateComputationPCF2StageFlow",
-            "PrivateComputationMRStageFlow",
-            "PrivateComputationPCF2LocalTestStageFlow",
-            "PrivateComputationPIDPATestStageFlow",
-        ]:
+        flow_cls_name = pc_instance.get_flow_cls_name
+        if flow_cls_name in PCF2_AGGREGATION_STAGE_FLOWS:
             return pc_instance.pcf2_aggregation_stage_output_base_path
-        elif pc_instance.get_flow_cls_name in [
-            "PrivateComputationPCF2LiftStageFlow",
-            "PrivateComputationPCF2LiftUDPStageFlow",
-            "PrivateComputationPCF2LiftLocalTestStageFlow",
-            "PrivateComputationMrPidPCF2LiftStageFlow",
-        ]:
+        elif flow_cls_name in PCF2_LIFT_STAGE_FLOWS:
             return pc_instance.pcf2_lift_stage_output_base_path
         else:
             if pc_instance.has_feature(PCSFeature.PRIVATE_LIFT_PCF2_RELEASE):
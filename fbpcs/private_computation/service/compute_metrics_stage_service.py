@@ -313,13 +313,13 @@ class ComputeMetricsStageService(PrivateComputationStageService):
         Returns:
             MPC game args to be used by onedocker
         """
+        num_files_per_mpc_container = (
+            private_computation_instance.infra_config.num_files_per_mpc_container
+        )
         game_args = [
             {
                 **common_compute_game_args,
-                **{
-                    "file_start_index": i
-                    * private_computation_instance.infra_config.num_files_per_mpc_container
-                },
+                "file_start_index": i * num_files_per_mpc_container,
             }
             for i in range(private_computation_instance.infra_config.num_mpc_containers)
         ]
@@ -342,8 +342,6 @@ class ComputeMetricsStageService(PrivateComputationStageService):
         Returns:
             MPC game args to be used by onedocker
         """
-        game_args = []
-
         attribution_config: AttributionConfig = checked_cast(
             AttributionConfig,
             private_computation_instance.product_config,
@@ -351,24 +349,29 @@ class ComputeMetricsStageService(PrivateComputationStageService):
         attribution_rule: AttributionRule = attribution_config.attribution_rule
 
         aggregation_type: AggregationType = attribution_config.aggregation_type
+        padding_size = attribution_config.common.padding_size
+        num_files_per_mpc_container = (
+            private_computation_instance.infra_config.num_files_per_mpc_container
+        )
 
+        # everything but file_start_index is the same for every container
+        attribution_game_args = {
+            **common_compute_game_args,
+            "aggregators": aggregation_type.value,
+            "attribution_rules": attribution_rule.value,
+            "use_xor_encryption": True,
+            "run_name": (
+                private_computation_instance.infra_config.instance_id
+                if self._log_cost_to_s3
+                else ""
+            ),
+            "max_num_touchpoints": padding_size,
+            "max_num_conversions": padding_size,
+        }
         game_args = [
             {
-                **common_compute_game_args,
-                **{
-                    "aggregators": aggregation_type.value,
-                    "attribution_rules": attribution_rule.value,
-                    "file_start_index": i
-                    * private_computation_instance.infra_config.num_files_per_mpc_container,
-                    "use_xor_encryption": True,
-                    "run_name": (
-                        private_computation_instance.infra_config.instance_id
-                        if self._log_cost_to_s3
-                        else ""
-                    ),
-                    "max_num_touchpoints": private_computation_instance.product_config.common.padding_size,
-                    "max_num_conversions": private_computation_instance.product_config.common.padding_size,
-                },
+                **attribution_game_args,
+                "file_start_index": i * num_files_per_mpc_container,
             }
             for i in range(private_computation_instance.infra_config.num_mpc_containers)
         ]
@@ -28,8 +28,9 @@ DEFAULT_CONTAINER_TIMEOUT_IN_SEC = 86400
 DEFAULT_SERVER_PORT_NUMBER = 15200
 MAX_ROWS_PER_PID_CONTAINER = 10_000_000
 TARGET_ROWS_PER_MPC_CONTAINER = 250_000
-NUM_NEW_SHARDS_PER_FILE: int = round(
-    MAX_ROWS_PER_PID_CONTAINER / TARGET_ROWS_PER_MPC_CONTAINER
+# the row counts divide evenly, so integer division gives the same 40 shards
+NUM_NEW_SHARDS_PER_FILE: int = (
+    MAX_ROWS_PER_PID_CONTAINER // TARGET_ROWS_PER_MPC_CONTAINER
 )
 
 DEFAULT_K_ANONYMITY_THRESHOLD_PL = 100
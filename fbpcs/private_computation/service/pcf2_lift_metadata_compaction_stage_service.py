@@ -106,9 +106,8 @@ class PCF2LiftMetadataCompactionStageService(PCF2BaseStageService):
         )
 
         run_name_base = (
-            private_computation_instance.infra_config.instance_id
-            + "_"
-            + GameNames.PCF2_LIFT_METADATA_COMPACTION.value
+            f"{private_computation_instance.infra_config.instance_id}_"
+            f"{GameNames.PCF2_LIFT_METADATA_COMPACTION.value}"
         )
 
         tls_args = get_tls_arguments(
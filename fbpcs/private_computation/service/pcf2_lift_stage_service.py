@@ -99,66 +99,72 @@ class PCF2LiftStageService(PCF2BaseStageService):
             ca_certificate_path,
         )
 
-        if private_computation_instance.has_feature(
+        infra_config = private_computation_instance.infra_config
+        common_product_config = private_computation_instance.product_config.common
+        num_files_per_mpc_container = infra_config.num_files_per_mpc_container
+        is_udp = private_computation_instance.has_feature(
             PCSFeature.PRIVATE_LIFT_UNIFIED_DATA_PROCESS
-        ):
-            num_lift_containers = (
-                private_computation_instance.infra_config.num_lift_containers
-            )
+        )
+        metadata_compaction_output_base_path: Optional[str] = None
+        if is_udp:
+            num_lift_containers = infra_config.num_lift_containers
             shards_per_file = distribute_files_among_containers(
-                private_computation_instance.infra_config.num_secure_random_shards,
+                infra_config.num_secure_random_shards,
                 num_lift_containers,
             )
-        else:
-            num_lift_containers = (
-                private_computation_instance.infra_config.num_mpc_containers
+            metadata_compaction_output_base_path = (
+                private_computation_instance.pcf2_lift_metadata_compaction_output_base_path
             )
+            input_base_path = f"{metadata_compaction_output_base_path}_secret_shares"
+        else:
+            num_lift_containers = infra_config.num_mpc_containers
+            input_base_path = private_computation_instance.data_processing_output_path
+
+        # args that are the same for every container
+        common_game_args: Dict[str, Any] = {
+            "input_base_path": input_base_path,
+            "output_base_path": private_computation_instance.pcf2_lift_stage_output_base_path,
+            "num_files": num_files_per_mpc_container,
+            "concurrency": infra_config.mpc_compute_concurrency,
+            "num_conversions_per_user": common_product_config.padding_size,
+            "log_cost": self._log_cost_to_s3,
+            "run_id": infra_config.run_id,
+            "log_cost_s3_bucket": infra_config.log_cost_bucket,
+            **tls_args,
+        }
+        feature_flags = private_computation_instance.feature_flags
+        if feature_flags is not None:
+            common_game_args["pc_feature_flags"] = feature_flags
+
+        post_processing_data = (
+            common_product_config.post_processing_data if self._log_cost_to_s3 else None
+        )
+        role_title = infra_config.role.value.title()
 
         cmd_args_list = []
+        file_start_index = 0
         for shard in range(num_lift_containers):
             run_name = f"{run_name_base}_{shard}" if self._log_cost_to_s3 else ""
 
             game_args: Dict[str, Any] = {
-                "input_base_path": private_computation_instance.data_processing_output_path,
-                "output_base_path": private_computation_instance.pcf2_lift_stage_output_base_path,
-                "file_start_index": shard
-                * private_computation_instance.infra_config.num_files_per_mpc_container,
-                "num_files": private_computation_instance.infra_config.num_files_per_mpc_container,
-                "concurrency": private_computation_instance.infra_config.mpc_compute_concurrency,
-                "num_conversions_per_user": private_computation_instance.product_config.common.padding_size,
+                **common_game_args,
                 "run_name": run_name,
-                "log_cost": self._log_cost_to_s3,
-                "run_id": private_computation_instance.infra_config.run_id,
-                "log_cost_s3_bucket": private_computation_instance.infra_config.log_cost_bucket,
-                **tls_args,
             }
-
-            if private_computation_instance.feature_flags is not None:
-                game_args["pc_feature_flags"] = (
-                    private_computation_instance.feature_flags
-                )
-
-            if private_computation_instance.has_feature(
-                PCSFeature.PRIVATE_LIFT_UNIFIED_DATA_PROCESS
-            ):
+            if is_udp:
                 # pyre-fixme[61]: `shards_per_file` is undefined, or not always defined.
-                game_args["file_start_index"] = sum(shards_per_file[0:shard])
-                # pyre-fixme[61]: `shards_per_file` is undefined, or not always defined.
-                game_args["num_files"] = shards_per_file[shard]
-                game_args["input_base_path"] = (
-                    private_computation_instance.pcf2_lift_metadata_compaction_output_base_path
-                    + "_secret_shares"
-                )
+                num_files = shards_per_file[shard]
+                game_args["file_start_index"] = file_start_index
+                game_args["num_files"] = num_files
+                file_start_index += num_files
                 game_args["input_global_params_path"] = (
-                    f"{private_computation_instance.pcf2_lift_metadata_compaction_output_base_path}_global_params_{shard}"
+                    f"{metadata_compaction_output_base_path}_global_params_{shard}"
                 )
+            else:
+                game_args["file_start_index"] = shard * num_files_per_mpc_container
 
-            if (
-                self._log_cost_to_s3
-                and private_computation_instance.product_config.common.post_processing_data
-            ):
-                private_computation_instance.product_config.common.post_processing_data.s3_cost_export_output_paths.add(
-                    f"pl-logs/{run_name}_{private_computation_instance.infra_config.role.value.title()}.json"
+            if post_processing_data:
+                post_processing_data.s3_cost_export_output_paths.add(
+                    f"pl-logs/{run_name}_{role_title}.json"
                 )
 
             cmd_args_list.append(game_args)
@@ -54,6 +54,7 @@ class PIDPrepareStageService(PrivateComputationStageService):
         _onedocker_svc: used to spin up containers that run binaries in the cloud
         _onedocker_binary_config: stores OneDocker information
         _containter_timeout: customed timeout for container
+        _pid_prepare_binary_service: builds args for and starts the PID prepare containers
     """
 
     def __init__(
@@ -67,6 +68,7 @@ class PIDPrepareStageService(PrivateComputationStageService):
         self._onedocker_svc = onedocker_svc
         self._onedocker_binary_config_map = onedocker_binary_config_map
         self._container_timeout = container_timeout
+        self._pid_prepare_binary_service = PIDPrepareBinaryService()
         self._logger: logging.Logger = logging.getLogger(__name__)
 
     async def run_async(
@@ -127,59 +129,61 @@ class PIDPrepareStageService(PrivateComputationStageService):
         server_ips: Optional[List[str]],
     ) -> List[ContainerInstance]:
         """start pid prepare service and spine up the container instances"""
-        logging.info("Instantiated PID prepare stage")
-        num_shards = pc_instance.infra_config.num_pid_containers
+        self._logger.info("Instantiated PID prepare stage")
+        infra_config = pc_instance.infra_config
+        common_product_config = pc_instance.product_config.common
+        num_shards = infra_config.num_pid_containers
         # input_path is the output_path from PID Shard Stage
         input_path = pc_instance.pid_stage_output_data_path
         output_path = pc_instance.pid_stage_output_prepare_path
-        pc_role = pc_instance.infra_config.role
-        # generate the list of command args for publisher or partner
-        args_list = []
+        pc_role = infra_config.role
         binary_name = PIDPrepareBinaryService.get_binary_name()
         onedocker_binary_config = self._onedocker_binary_config_map[binary_name]
         id_filter_thresh = -1
 
-        if pc_instance.has_feature(
-            PCSFeature.PID_FILTER_LOW_QUALITY_IDENTIFIER_THRESH166
-        ) and (
-            pc_instance.product_config.common.pid_protocol
-            == PIDProtocol.UNION_PID_MULTIKEY
+        if (
+            pc_instance.has_feature(
+                PCSFeature.PID_FILTER_LOW_QUALITY_IDENTIFIER_THRESH166
+            )
+            and common_product_config.pid_protocol == PIDProtocol.UNION_PID_MULTIKEY
         ):
             # if it is multi-key and if feature is enabled,
             # we will be filtering identifiers with its appearance above threshold.
             id_filter_thresh = DEFAULT_IDENTIFIER_FILTER_THRESH
 
-        for shard in range(num_shards):
-            args_per_shard = PIDPrepareBinaryService.build_args(
+        # generate the list of command args for publisher or partner
+        tmp_directory = onedocker_binary_config.tmp_directory
+        max_column_count = common_product_config.pid_max_column_count
+        run_id = infra_config.run_id
+        args_list = [
+            PIDPrepareBinaryService.build_args(
                 input_path=get_sharded_filepath(input_path, shard),
                 output_path=get_sharded_filepath(output_path, shard),
-                tmp_directory=onedocker_binary_config.tmp_directory,
-                max_column_count=pc_instance.product_config.common.pid_max_column_count,
+                tmp_directory=tmp_directory,
+                max_column_count=max_column_count,
                 id_filter_thresh=id_filter_thresh,
-                run_id=pc_instance.infra_config.run_id,
+                run_id=run_id,
             )
-            args_list.append(args_per_shard)
+            for shard in range(num_shards)
+        ]
         # start containers
-        logging.info(f"{pc_role} spinning up containers")
+        self._logger.info(f"{pc_role} spinning up containers")
 
-        pid_prepare_binary_service = PIDPrepareBinaryService()
         env_vars = generate_env_vars_dict(
             repository_path=onedocker_binary_config.repository_path
         )
-        should_wait_spin_up: bool = (
-            pc_instance.infra_config.role is PrivateComputationRole.PARTNER
-        )
+        should_wait_spin_up: bool = pc_role is PrivateComputationRole.PARTNER
 
         container_type = None
         if num_shards == 1 and pc_instance.has_feature(
             PCSFeature.PID_SNMK_LARGER_CONTAINER_TYPE
         ):
             # Use large FARGATE container for SNMK
-            logging.info("Setting pid prepare stage container to LARGE")
+            self._logger.info("Setting pid prepare stage container to LARGE")
             container_type = ContainerType.LARGE
         container_permission = gen_container_permission(pc_instance)
 
-        return await pid_prepare_binary_service.start_containers(
+        return await self._pid_prepare_binary_service.start_containers(
             cmd_args_list=args_list,
             onedocker_svc=self._onedocker_svc,
             binary_version=onedocker_binary_config.binary_version,
@@ -65,6 +65,7 @@ class PIDRunProtocolStageService(PrivateComputationStageService):
         _storage_svc: used to read/write files during private computation runs
         _onedocker_svc: used to spin up containers that run binaries in the cloud
         _onedocker_binary_config: stores OneDocker information
+        _pid_run_protocol_binary_service: builds args for and starts the PID protocol containers
     """
 
     def __init__(
@@ -76,6 +77,7 @@ class PIDRunProtocolStageService(PrivateComputationStageService):
         self._storage_svc = storage_svc
         self._onedocker_svc = onedocker_svc
         self._onedocker_binary_config_map = onedocker_binary_config_map
+        self._pid_run_protocol_binary_service = PIDRunProtocolBinaryService()
         self._logger: logging.Logger = logging.getLogger(__name__)
 
     async def run_async(
@@ -168,29 +170,29 @@ class PIDRunProtocolStageService(PrivateComputationStageService):
         port: int = DEFAULT_SERVER_PORT_NUMBER,
     ) -> List[ContainerInstance]:
         """start pid run protocol service and spine up the container instances"""
-        pid_run_protocol_binary_service = PIDRunProtocolBinaryService()
-        logging.info("Instantiated PID run protocol stage")
-        num_shards = pc_instance.infra_config.num_pid_containers
+        pid_run_protocol_binary_service = self._pid_run_protocol_binary_service
+        infra_config = pc_instance.infra_config
+        common_product_config = pc_instance.product_config.common
+        num_shards = infra_config.num_pid_containers
         # input_path is the output_path from PIDPrepareStage
         input_path = pc_instance.pid_stage_output_prepare_path
         output_path = pc_instance.pid_stage_output_spine_path
-        pc_role = pc_instance.infra_config.role
-        pid_protocol = pc_instance.product_config.common.pid_protocol
+        pc_role = infra_config.role
+        pid_protocol = common_product_config.pid_protocol
+        is_tls_enabled = infra_config.is_tls_enabled
         metric_paths = self.get_metric_paths(pc_role, output_path, num_shards)
         server_endpoints = self.get_server_hostnames(
             pc_role,
             server_ips,
             server_hostnames,
             num_shards,
-            pc_instance.infra_config.is_tls_enabled,
+            is_tls_enabled,
         )
-        use_row_numbers = pc_instance.product_config.common.pid_use_row_numbers
-        if use_row_numbers:
-            logging.info("use-row-numbers is enabled for Private ID")
+        use_row_numbers = common_product_config.pid_use_row_numbers
         # generate the list of command args for publisher or partner
-        args_list = []
-        for shard in range(num_shards):
-            args_per_shard = pid_run_protocol_binary_service.build_args(
+        run_id = infra_config.run_id
+        args_list = [
+            pid_run_protocol_binary_service.build_args(
                 input_path=get_sharded_filepath(input_path, shard),
                 output_path=get_sharded_filepath(output_path, shard),
                 port=port,
@@ -199,18 +201,17 @@ class PIDRunProtocolStageService(PrivateComputationStageService):
                 metric_path=metric_paths[shard] if metric_paths else None,
                 use_row_numbers=use_row_numbers,
                 server_endpoint=server_endpoints[shard] if server_endpoints else None,
-                run_id=pc_instance.infra_config.run_id,
+                run_id=run_id,
             )
-            args_list.append(args_per_shard)
-        # start containers
-        logging.info(f"{pc_role} spinning up containers")
+            for shard in range(num_shards)
+        ]
         binary_name = pid_run_protocol_binary_service.get_binary_name(
             pid_protocol, pc_role
         )
         onedocker_binary_config = self._onedocker_binary_config_map[binary_name]
         env_vars = None
         env_vars_list = None
-        if pc_instance.infra_config.is_tls_enabled:
+        if is_tls_enabled:
             env_vars_list = generate_env_vars_dicts_list(
                 num_containers=num_shards,
                 repository_path=onedocker_binary_config.repository_path,
@@ -221,27 +222,30 @@ class PIDRunProtocolStageService(PrivateComputationStageService):
                 server_ip_addresses=server_ips,
                 server_hostnames=server_hostnames,
                 server_private_key_ref_provider=server_private_key_ref_provider,
+                RUST_LOG="info",
             )
-            for envs in env_vars_list:
-                envs.update({"RUST_LOG": "info"})
         else:
             env_vars = generate_env_vars_dict(
                 repository_path=onedocker_binary_config.repository_path,
                 RUST_LOG="info",
             )
-        should_wait_spin_up: bool = (
-            pc_instance.infra_config.role is PrivateComputationRole.PARTNER
-        )
+        should_wait_spin_up: bool = pc_role is PrivateComputationRole.PARTNER
 
         container_type = None
         if pid_protocol == PIDProtocol.UNION_PID_MULTIKEY and pc_instance.has_feature(
             PCSFeature.PID_SNMK_LARGER_CONTAINER_TYPE
         ):
             # Use large FARGATE container for SNMK
-            logging.info("Setting pid run protocol stage container to LARGE")
             container_type = ContainerType.LARGE
         container_permission = gen_container_permission(pc_instance)
 
+        # start containers
+        self._logger.info(
+            f"{pc_role} spinning up {num_shards} PID run protocol containers: "
+            f"pid_protocol={pid_protocol}, tls_enabled={is_tls_enabled}, "
+            f"use_row_numbers={use_row_numbers}, container_type={container_type}"
+        )
+
         return await pid_run_protocol_binary_service.start_containers(
             cmd_args_list=args_list,
             onedocker_svc=self._onedocker_svc,
@@ -252,11 +256,7 @@ class PIDRunProtocolStageService(PrivateComputationStageService):
             existing_containers=pc_instance.get_existing_containers_for_retry(),
             container_type=container_type,
             env_vars_list=env_vars_list,
-            opa_workflow_path=(
-                TLS_OPA_WORKFLOW_PATH
-                if pc_instance.infra_config.is_tls_enabled
-                else None
-            ),
+            opa_workflow_path=TLS_OPA_WORKFLOW_PATH if is_tls_enabled else None,
             permission=container_permission,
         )
 
@@ -283,21 +283,18 @@ class PIDRunProtocolStageService(PrivateComputationStageService):
             return None
 
         if enabled_tls:
-            if not server_hostnames:
-                raise ValueError("Partner missing server_hostnames")
-            if len(server_hostnames) != num_shards:
-                raise ValueError(
-                    f"Supplied {len(server_hostnames)} server_hostnames, but num_shards == {num_shards} (these should agree)"
-                )
-            return [f"https://{hostname}" for hostname in server_hostnames]
+            endpoints, scheme = server_hostnames, "https"
+            endpoints_name = "server_hostnames"
         else:
-            if not server_ips:
-                raise ValueError("Partner missing server_ips")
-            if len(server_ips) != num_shards:
-                raise ValueError(
-                    f"Supplied {len(server_ips)} server_hostnames, but num_shards == {num_shards} (these should agree)"
-                )
-            return [f"http://{ip}" for ip in server_ips]
+            endpoints, scheme = server_ips, "http"
+            endpoints_name = "server_ips"
+        if not endpoints:
+            raise ValueError(f"Partner missing {endpoints_name}")
+        if len(endpoints) != num_shards:
+            raise ValueError(
+                f"Supplied {len(endpoints)} {endpoints_name}, but num_shards == {num_shards} (these should agree)"
+            )
+        return [f"{scheme}://{endpoint}" for endpoint in endpoints]
 
     def stop_service(
         self,
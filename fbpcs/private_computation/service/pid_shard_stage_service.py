@@ -51,6 +51,7 @@ class PIDShardStageService(PrivateComputationStageService):
         _onedocker_svc: used to spin up containers that run binaries in the cloud
         _onedocker_binary_config: stores OneDocker information
         _containter_timeout: customed timeout for container
+        _sharding_service: builds args for and starts the PID sharder container
     """
 
     def __init__(
@@ -65,6 +66,7 @@ class PIDShardStageService(PrivateComputationStageService):
         self._onedocker_svc = onedocker_svc
         self._onedocker_binary_config_map = onedocker_binary_config_map
         self._container_timeout = container_timeout
+        self._sharding_service = ShardingService()
         self._logger: logging.Logger = logging.getLogger(__name__)
         self._trace_logging_svc = trace_logging_svc
 
@@ -136,7 +138,6 @@ class PIDShardStageService(PrivateComputationStageService):
         input_path = pc_instance.product_config.common.input_path
         output_base_path = pc_instance.pid_stage_output_data_path
         pc_role = pc_instance.infra_config.role
-        sharding_binary_service = ShardingService()
         # generate the list of command args for publisher or partner
         binary_name = ShardingService.get_binary_name(ShardType.HASHED_FOR_PID)
         onedocker_binary_config = self._onedocker_binary_config_map[binary_name]
@@ -158,7 +159,7 @@ class PIDShardStageService(PrivateComputationStageService):
         )
         container_permission = gen_container_permission(pc_instance)
 
-        return await sharding_binary_service.start_containers(
+        return await self._sharding_service.start_containers(
             cmd_args_list=[args],
             onedocker_svc=self._onedocker_svc,
             binary_version=onedocker_binary_config.binary_version,
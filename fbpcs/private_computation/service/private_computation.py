@@ -166,6 +166,10 @@ class PrivateComputationService:
             self.metric_svc,
             self.trace_logging_svc,
         )
+        # stage services only hold the shared clients above, so each one is built once
+        self._stage_services: Dict[
+            PrivateComputationBaseStageFlow, PrivateComputationStageService
+        ] = {}
         self.logger: logging.Logger = (
             logging.getLogger(__name__) if logger is None else logger
         )
@@ -240,7 +244,7 @@ class PrivateComputationService:
             instances=[],
             game_type=game_type,
             tier=tier,
-            pcs_features=pcs_feature_enums,
+            pcs_features=PCSFeature.to_bitmask(pcs_feature_enums),
             pce_config=pce_config,
             _stage_flow_cls_name=get_stage_flow(
                 game_type=game_type,
@@ -363,6 +367,16 @@ class PrivateComputationService:
         ):
             self.instance_repository.update(instance=instance)
 
+    def _get_stage_service(
+        self, stage: PrivateComputationBaseStageFlow
+    ) -> PrivateComputationStageService:
+        """Returns the stage service for stage, building it on first use"""
+        stage_svc = self._stage_services.get(stage)
+        if stage_svc is None:
+            stage_svc = stage.get_stage_service(self.stage_service_args)
+            self._stage_services[stage] = stage_svc
+        return stage_svc
+
     def _get_number_of_mpc_containers(
         self,
         game_type: PrivateComputationGameType,
@@ -410,7 +424,7 @@ class PrivateComputationService:
         ) or private_computation_instance.stage_flow.is_started_status(
             private_computation_instance.infra_config.status
         ):
-            self.logger.info(f"Updating instance: {instance_id}")
+            self.logger.info("Updating instance: %s", instance_id)
             return self._update_instance(
                 private_computation_instance=private_computation_instance
             )
@@ -419,7 +433,9 @@ class PrivateComputationService:
             # don't need to update the status
             # trying to prevent issues like this: https://fburl.com/yrrozywg
             self.logger.info(
-                f"Not updating {instance_id}: status is {private_computation_instance.infra_config.status}"
+                "Not updating %s: status is %s",
+                instance_id,
+                private_computation_instance.infra_config.status,
             )
             return private_computation_instance
 
@@ -427,8 +443,10 @@ class PrivateComputationService:
         self, private_computation_instance: PrivateComputationInstance
     ) -> PrivateComputationInstance:
         stage = private_computation_instance.current_stage
-        stage_svc = stage.get_stage_service(self.stage_service_args)
-        self.logger.info(f"Updating instance | {stage}={stage!r}")
+        stage_svc = self._get_stage_service(stage)
+        # update_instance is polled, so leave the formatting of the (long) stage repr
+        # to logging, which skips it when INFO is disabled
+        self.logger.info("Updating instance | %s=%r", stage, stage)
         try:
             new_status = stage_svc.get_status(private_computation_instance)
             private_computation_instance.update_status(new_status, self.logger)
@@ -450,7 +468,8 @@ class PrivateComputationService:
                 f"Got ThrottlingError when updating instance. Skipping update! Error: {e}"
             )
         self.logger.info(
-            f"Finished updating instance: {private_computation_instance.infra_config.instance_id}"
+            "Finished updating instance: %s",
+            private_computation_instance.infra_config.instance_id,
         )
 
         return private_computation_instance
@@ -556,8 +575,10 @@ class PrivateComputationService:
                 f"Instance {instance_id} has no eligible stages to run at this time (status: {pc_instance.infra_config.status})"
             )
 
-        return await self.run_stage_async(
-            instance_id,
+        # validate the instance we already read instead of reading it again
+        pc_instance = self._get_validated_instance(pc_instance, next_stage, server_ips)
+        return await self._run_validated_stage_async(
+            pc_instance,
             next_stage,
             server_ips=server_ips,
             ca_certificate=ca_certificate,
@@ -589,16 +610,20 @@ class PrivateComputationService:
 
     def _get_validated_instance(
         self,
-        instance_id: str,
+        instance_or_id: Union[str, PrivateComputationInstance],
         stage: PrivateComputationBaseStageFlow,
         server_ips: Optional[List[str]] = None,
         dry_run: bool = False,
     ) -> PrivateComputationInstance:
         """
-        Gets a private computation instance and checks that it's ready to run a given
-        stage service
+        Gets a private computation instance, unless it was already read by the caller,
+        and checks that it's ready to run a given stage service
         """
-        pc_instance = self._instance_repo_read(instance_id)
+        if isinstance(instance_or_id, str):
+            pc_instance = self._instance_repo_read(instance_or_id)
+        else:
+            pc_instance = instance_or_id
+        instance_id = pc_instance.infra_config.instance_id
         if (
             stage.is_joint_stage
             and pc_instance.infra_config.role is PrivateComputationRole.PARTNER
@@ -715,7 +740,26 @@ class PrivateComputationService:
         pc_instance = self._get_validated_instance(
             instance_id, stage, server_ips, dry_run
         )
+        return await self._run_validated_stage_async(
+            pc_instance,
+            stage,
+            stage_svc,
+            server_ips,
+            ca_certificate,
+            server_hostnames,
+        )
 
+    async def _run_validated_stage_async(
+        self,
+        pc_instance: PrivateComputationInstance,
+        stage: PrivateComputationBaseStageFlow,
+        stage_svc: Optional[PrivateComputationStageService] = None,
+        server_ips: Optional[List[str]] = None,
+        ca_certificate: Optional[str] = None,
+        server_hostnames: Optional[List[str]] = None,
+    ) -> PrivateComputationInstance:
+        """Runs a stage for an instance that already passed _get_validated_instance"""
+        instance_id = pc_instance.infra_config.instance_id
         # TODO: T136265785 refactor the tls input validation logic into a TLS config class
         enable_tls = pc_instance.infra_config.is_tls_enabled
         if enable_tls:
@@ -747,7 +791,7 @@ class PrivateComputationService:
             status=CheckpointStatus.STARTED,
         )
         try:
-            stage_svc = stage_svc or stage.get_stage_service(self.stage_service_args)
+            stage_svc = stage_svc or self._get_stage_service(stage)
             pc_instance = await stage_svc.run_async(
                 pc_instance,
                 server_certificate_provider,
@@ -928,7 +972,7 @@ class PrivateComputationService:
         self.logger.info(
             f"Canceling the current stage {stage} of instance {instance_id}"
         )
-        stage_svc = stage.get_stage_service(self.stage_service_args)
+        stage_svc = self._get_stage_service(stage)
         # TODO: T124322832 make stop service as abstract method and enforce all stage service to implement
         try:
             stage_svc.stop_service(private_computation_instance)
@@ -970,7 +1014,7 @@ class PrivateComputationService:
 
     @staticmethod
     def get_ts_now() -> int:
-        return int(datetime.now(tz=timezone.utc).timestamp())
+        return int(time.time())
 
     def _get_param(
         self, param_name: str, instance_param: Optional[T], override_param: Optional[T]
@@ -7,6 +7,7 @@
 # pyre-strict
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from typing import Dict, Optional
 
@@ -140,6 +141,8 @@ class PrivateComputationServiceData:
     )
 
     @classmethod
+    # the stage data for a game type never changes, so build it once per game type
+    @lru_cache(maxsize=None)
     def get(
         cls, game_type: PrivateComputationGameType
     ) -> "PrivateComputationServiceData":
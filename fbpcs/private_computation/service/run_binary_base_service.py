@@ -7,6 +7,7 @@
 # pyre-strict
 
 import asyncio
+import functools
 import logging
 from typing import Dict, List, Optional
 
@@ -71,20 +72,27 @@ class RunBinaryBaseService:
             logger.info(f"Spinning up {len(containers_to_start)} containers")
             logger.info(f"Containers to start: {containers_to_start}")
 
-            new_pending_containers = onedocker_svc.start_containers(
-                package_name=binary_name,
-                version=binary_version,
-                cmd_args_list=[cmd_args_list[i] for i in containers_to_start],
-                timeout=timeout,
-                env_vars=(
-                    [env_vars_list[i] for i in containers_to_start]
-                    if env_vars_list
-                    else env_vars
+            # starting containers is a blocking call to the cloud provider, so run it
+            # in the default executor to keep the event loop free for other stages
+            loop = asyncio.get_running_loop()
+            new_pending_containers = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    onedocker_svc.start_containers,
+                    package_name=binary_name,
+                    version=binary_version,
+                    cmd_args_list=[cmd_args_list[i] for i in containers_to_start],
+                    timeout=timeout,
+                    env_vars=(
+                        [env_vars_list[i] for i in containers_to_start]
+                        if env_vars_list
+                        else env_vars
+                    ),
+                    container_type=container_type,
+                    certificate_request=certificate_request,
+                    opa_workflow_path=opa_workflow_path,
+                    permission=permission,
                 ),
-                container_type=container_type,
-                certificate_request=certificate_request,
-                opa_workflow_path=opa_workflow_path,
-                permission=permission,
             )
 
             pending_containers = self.get_pending_containers(
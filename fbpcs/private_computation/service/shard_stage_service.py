@@ -8,7 +8,6 @@
 
 
 import logging
-import math
 from typing import DefaultDict, List, Optional
 
 from fbpcp.entity.container_instance import ContainerInstance
@@ -42,6 +41,7 @@ class ShardStageService(PrivateComputationStageService):
     Private attributes:
         _onedocker_svc: Spins up containers that run binaries in the cloud
         _onedocker_binary_config_map: Stores a mapping from mpc game to OneDockerBinaryConfig (binary version and tmp directory)
+        _sharding_service: builds args for and starts the sharder containers
     """
 
     def __init__(
@@ -51,6 +51,7 @@ class ShardStageService(PrivateComputationStageService):
     ) -> None:
         self._onedocker_svc = onedocker_svc
         self._onedocker_binary_config_map = onedocker_binary_config_map
+        self._sharding_service = ShardingService()
         self._logger: logging.Logger = logging.getLogger(__name__)
 
     async def run_async(
@@ -148,37 +149,37 @@ class ShardStageService(PrivateComputationStageService):
         Returns:
             return: list of container instances running combiner service
         """
-        sharder = ShardingService()
-        logging.info("Instantiated sharder")
+        sharder = self._sharding_service
+        infra_config = private_computation_instance.infra_config
+        num_shards = infra_config.num_pid_containers
+        # ceil(num_mpc_containers * num_files_per_mpc_container / num_shards) in exact
+        # integer arithmetic; the float version can round an exact quotient up
+        shards_per_file = (
+            infra_config.num_mpc_containers * infra_config.num_files_per_mpc_container
+            + num_shards
+            - 1
+        ) // num_shards
+        binary_config = onedocker_binary_config_map[OneDockerBinaryNames.SHARDER.value]
+        tmp_directory = binary_config.tmp_directory
 
         args_list = []
-        for shard_index in range(
-            private_computation_instance.infra_config.num_pid_containers
-        ):
+        for shard_index in range(num_shards):
             path_to_input_shard = get_sharded_filepath(combine_output_path, shard_index)
-            logging.info(f"Input path to sharder: {path_to_input_shard}")
-
-            shards_per_file = math.ceil(
-                (
-                    private_computation_instance.infra_config.num_mpc_containers
-                    / private_computation_instance.infra_config.num_pid_containers
-                )
-                * private_computation_instance.infra_config.num_files_per_mpc_container
-            )
+            logging.info("Input path to sharder: %s", path_to_input_shard)
+
             shard_index_offset = shard_index * shards_per_file
             logging.info(
-                f"Output base path to sharder: {shard_output_base_path}, {shard_index_offset=}"
+                "Output base path to sharder: %s, shard_index_offset=%s",
+                shard_output_base_path,
+                shard_index_offset,
             )
 
-            binary_config = onedocker_binary_config_map[
-                OneDockerBinaryNames.SHARDER.value
-            ]
             args_per_shard = sharder.build_args(
                 filepath=path_to_input_shard,
                 output_base_path=shard_output_base_path,
                 file_start_index=shard_index_offset,
                 num_output_files=shards_per_file,
-                tmp_directory=binary_config.tmp_directory,
+                tmp_directory=tmp_directory,
             )
             args_list.append(args_per_shard)
 
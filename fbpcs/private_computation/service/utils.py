@@ -288,6 +288,7 @@ def generate_env_vars_dicts_list(
     server_ip_addresses: Optional[List[str]] = None,
     server_hostnames: Optional[List[str]] = None,
     server_private_key_ref_provider: Optional[PrivateKeyReferenceProvider] = None,
+    **kwargs: Optional[str],
 ) -> List[Dict[str, str]]:
 
     _validate_env_vars_length(
@@ -296,18 +297,30 @@ def generate_env_vars_dicts_list(
         server_hostnames=server_hostnames,
     )
 
+    # certificates and key refs are the same for every container, so fetch them once
+    # and only add the per-container server address on top
+    common_env_vars = generate_env_vars_dict(
+        repository_path=repository_path,
+        server_certificate_provider=server_certificate_provider,
+        server_certificate_path=server_certificate_path,
+        ca_certificate_provider=ca_certificate_provider,
+        ca_certificate_path=ca_certificate_path,
+        server_private_key_ref_provider=server_private_key_ref_provider,
+        **kwargs,
+    )
+    if not (server_ip_addresses and server_hostnames):
+        return [common_env_vars.copy() for _ in range(num_containers)]
+
+    # only set if both present, since variables are used for mapping between these values
     return [
-        generate_env_vars_dict(
-            repository_path=repository_path,
-            server_certificate_provider=server_certificate_provider,
-            server_certificate_path=server_certificate_path,
-            ca_certificate_provider=ca_certificate_provider,
-            ca_certificate_path=ca_certificate_path,
-            server_ip_address=server_ip_addresses[i] if server_ip_addresses else None,
-            server_hostname=server_hostnames[i] if server_hostnames else None,
-            server_private_key_ref_provider=server_private_key_ref_provider,
+        {
+            **common_env_vars,
+            SERVER_HOSTNAME_ENV_VAR: server_hostname,
+            SERVER_IP_ADDRESS_ENV_VAR: server_ip_address,
+        }
+        for server_hostname, server_ip_address in zip(
+            server_hostnames, server_ip_addresses
         )
-        for i in range(num_containers)
     ]
 
 
@@ -5,7 +5,7 @@
 
 # pyre-unsafe
 
-from typing import Optional, TYPE_CHECKING
+from typing import Callable, Dict, Optional, TYPE_CHECKING
 
 from fbpcs.private_computation.service.aggregate_shards_stage_service import (
     AggregateShardsStageService,
@@ -43,64 +43,65 @@ if TYPE_CHECKING:
     )
 
 
+StageServiceBuilder = Callable[
+    [PrivateComputationStageServiceArgs], PrivateComputationStageService
+]
+
+
 class StageSelector:
+    # stage name -> builder of the default stage service for that stage
+    _STAGE_SERVICE_BUILDERS: Dict[str, StageServiceBuilder] = {
+        "CREATED": lambda args: DummyStageService(),
+        "PC_PRE_VALIDATION": lambda args: PCPreValidationStageService(
+            args.pc_validator_config,
+            args.onedocker_svc,
+            args.onedocker_binary_config_map,
+            args.trace_logging_svc,
+        ),
+        "PID_SHARD": lambda args: PIDShardStageService(
+            args.storage_svc,
+            args.onedocker_svc,
+            args.onedocker_binary_config_map,
+            args.trace_logging_svc,
+        ),
+        "PID_PREPARE": lambda args: PIDPrepareStageService(
+            args.storage_svc,
+            args.onedocker_svc,
+            args.onedocker_binary_config_map,
+        ),
+        "ID_MATCH": lambda args: PIDRunProtocolStageService(
+            args.storage_svc,
+            args.onedocker_svc,
+            args.onedocker_binary_config_map,
+        ),
+        "ID_MATCH_POST_PROCESS": lambda args: PostProcessingStageService(
+            args.storage_svc, args.pid_post_processing_handlers
+        ),
+        "ID_SPINE_COMBINER": lambda args: IdSpineCombinerStageService(
+            args.storage_svc,
+            args.onedocker_svc,
+            args.onedocker_binary_config_map,
+        ),
+        "RESHARD": lambda args: ShardStageService(
+            args.onedocker_svc,
+            args.onedocker_binary_config_map,
+        ),
+        "AGGREGATE": lambda args: AggregateShardsStageService(
+            args.onedocker_binary_config_map,
+            args.mpc_svc,
+        ),
+        "POST_PROCESSING_HANDLERS": lambda args: PostProcessingStageService(
+            args.storage_svc, args.post_processing_handlers
+        ),
+    }
+
     @classmethod
     def get_stage_service(
         cls,
         stage_flow: "PrivateComputationBaseStageFlow",
         args: PrivateComputationStageServiceArgs,
     ) -> Optional[PrivateComputationStageService]:
-        if stage_flow.name == "CREATED":
-            return DummyStageService()
-        elif stage_flow.name == "PC_PRE_VALIDATION":
-            return PCPreValidationStageService(
-                args.pc_validator_config,
-                args.onedocker_svc,
-                args.onedocker_binary_config_map,
-                args.trace_logging_svc,
-            )
-        elif stage_flow.name == "PID_SHARD":
-            return PIDShardStageService(
-                args.storage_svc,
-                args.onedocker_svc,
-                args.onedocker_binary_config_map,
-                args.trace_logging_svc,
-            )
-        elif stage_flow.name == "PID_PREPARE":
-            return PIDPrepareStageService(
-                args.storage_svc,
-                args.onedocker_svc,
-                args.onedocker_binary_config_map,
-            )
-        elif stage_flow.name == "ID_MATCH":
-            return PIDRunProtocolStageService(
-                args.storage_svc,
-                args.onedocker_svc,
-                args.onedocker_binary_config_map,
-            )
-        elif stage_flow.name == "ID_MATCH_POST_PROCESS":
-            return PostProcessingStageService(
-                args.storage_svc, args.pid_post_processing_handlers
-            )
-        elif stage_flow.name == "ID_SPINE_COMBINER":
-            return IdSpineCombinerStageService(
-                args.storage_svc,
-                args.onedocker_svc,
-                args.onedocker_binary_config_map,
-            )
-        elif stage_flow.name == "RESHARD":
-            return ShardStageService(
-                args.onedocker_svc,
-                args.onedocker_binary_config_map,
-            )
-        elif stage_flow.name == "AGGREGATE":
-            return AggregateShardsStageService(
-                args.onedocker_binary_config_map,
-                args.mpc_svc,
-            )
-        elif stage_flow.name == "POST_PROCESSING_HANDLERS":
-            return PostProcessingStageService(
-                args.storage_svc, args.post_processing_handlers
-            )
-        else:
+        builder = cls._STAGE_SERVICE_BUILDERS.get(stage_flow.name)
+        if builder is None:
             return None
+        return builder(args)
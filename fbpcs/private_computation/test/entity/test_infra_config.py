@@ -5,10 +5,12 @@
 
 # pyre-unsafe
 
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 
 from fbpcs.private_computation.entity.infra_config import (
+    append_status_updates,
     InfraConfig,
     post_update_status,
     PrivateComputationGameType,
@@ -19,6 +21,9 @@ from fbpcs.private_computation.entity.pcs_feature import PCSFeature
 from fbpcs.private_computation.entity.private_computation_instance import (
     PrivateComputationInstanceStatus,
 )
+from fbpcs.private_computation.stage_flows.private_computation_pcf2_stage_flow import (
+    PrivateComputationPCF2StageFlow,
+)
 
 
 class TestInfraConfig(unittest.TestCase):
@@ -63,6 +68,48 @@ class TestInfraConfig(unittest.TestCase):
         # Assert
         self.assertTrue(is_tls_enabled)
 
+    def test_pcs_features_serde(self):
+        # Arrange
+        config = self._create_config(
+            PrivateComputationGameType.LIFT,
+            {PCSFeature.PCF_TLS, PCSFeature.PCS_DUMMY},
+        )
+
+        # Act
+        json_object = json.loads(InfraConfig.schema().dumps(config))
+        loaded_config = InfraConfig.schema().loads(json.dumps(json_object))
+
+        # Assert
+        self.assertEqual(
+            [PCSFeature.PCS_DUMMY.value, PCSFeature.PCF_TLS.value],
+            json_object["pcs_features"],
+        )
+        self.assertEqual(config.pcs_features, loaded_config.pcs_features)
+        self.assertTrue(loaded_config.has_feature(PCSFeature.PCF_TLS))
+        self.assertFalse(loaded_config.has_feature(PCSFeature.UNKNOWN))
+
+    def test_stage_flow_cls_name_is_interned(self):
+        # Arrange
+        config = self._create_config(PrivateComputationGameType.LIFT, set())
+        # build the name at runtime so it isn't a constant the compiler interns
+        stage_flow_cls_name = "".join(["PrivateComputation", "PCF2StageFlow"])
+
+        # Act
+        loaded_config = InfraConfig.schema().loads(
+            json.dumps(
+                {
+                    **json.loads(InfraConfig.schema().dumps(config)),
+                    "_stage_flow_cls_name": stage_flow_cls_name,
+                }
+            )
+        )
+
+        # Assert
+        self.assertIs(
+            PrivateComputationPCF2StageFlow.__name__,
+            loaded_config._stage_flow_cls_name,
+        )
+
     def _create_config(self, game_type, pcs_features):
         return InfraConfig(
             instance_id="test-instance-id",
@@ -75,7 +122,7 @@ class TestInfraConfig(unittest.TestCase):
             num_mpc_containers=1,
             num_files_per_mpc_container=1,
             status_updates=[],
-            pcs_features=pcs_features,
+            pcs_features=PCSFeature.to_bitmask(pcs_features),
         )
 
 
@@ -133,6 +180,8 @@ class TestInfraConfigFreeFunctions(unittest.TestCase):
             )
         ]
 
+        mock_time.reset_mock()
+
         # Act
         post_update_status(config)
 
@@ -140,12 +189,42 @@ class TestInfraConfigFreeFunctions(unittest.TestCase):
         self.assertEqual(expected_status_updates, config.status_updates)
         # Check that the end_ts was updated
         self.assertEqual(555, config.end_ts)
+        # Check that the clock was read only once
+        mock_time.assert_called_once()
 
     def test_append_status_updates(self) -> None:
-        pass
+        # Arrange
+        config = InfraConfig(
+            instance_id="test_instance_123",
+            role=PrivateComputationRole.PARTNER,
+            status=PrivateComputationInstanceStatus.ID_MATCHING_STARTED,
+            status_update_ts=0,
+            instances=[],
+            game_type=PrivateComputationGameType.ATTRIBUTION,
+            num_pid_containers=10,
+            num_mpc_containers=20,
+            num_files_per_mpc_container=100,
+            status_updates=[],
+        )
 
-    def test_raise_containers_error(self) -> None:
-        pass
+        # Act
+        for ts in (100, 130):
+            config.status_update_ts = ts
+            append_status_updates(config)
 
-    def test_not_valid_containers(self) -> None:
-        pass
+        # Assert
+        self.assertEqual(
+            [
+                StatusUpdate(
+                    status=config.status,
+                    status_update_ts=100,
+                    status_update_ts_delta=0,
+                ),
+                StatusUpdate(
+                    status=config.status,
+                    status_update_ts=130,
+                    status_update_ts_delta=30,
+                ),
+            ],
+            config.status_updates,
+        )
@@ -37,3 +37,17 @@ class TestPcsFeatureEnum(unittest.TestCase):
     def test_pcs_feature_enum_unkown(self) -> None:
         feature = PCSFeature.from_str("unknown_feature")
         self.assertEqual(feature, PCSFeature.UNKNOWN)
+
+    def test_pcs_feature_bitmask_round_trip(self) -> None:
+        features = [PCSFeature.PCS_DUMMY, PCSFeature.PCF_TLS, PCSFeature.UNKNOWN]
+        bitmask = PCSFeature.to_bitmask(features)
+
+        self.assertEqual(features, PCSFeature.from_bitmask(bitmask))
+        self.assertEqual(0, PCSFeature.to_bitmask([]))
+        self.assertEqual([], PCSFeature.from_bitmask(0))
+
+    def test_pcs_feature_bitmask_is_distinct(self) -> None:
+        bitmasks = [feature.bitmask for feature in PCSFeature]
+        self.assertEqual(len(PCSFeature), len(set(bitmasks)))
+        for bitmask in bitmasks:
+            self.assertEqual(1, bin(bitmask).count("1"))
@@ -24,12 +24,12 @@ class TestPrivateComputationGameRepository(unittest.TestCase):
         {
             "attribution_compute_dev": {
                 "onedocker_package_name": "private_attribution/compute-dev",
-                "arguments": [
+                "arguments": (
                     OneDockerArgument(name="aggregators", required=True),
                     OneDockerArgument(name="input_path", required=True),
                     OneDockerArgument(name="output_path", required=True),
                     OneDockerArgument(name="attribution_rules", required=True),
-                ],
+                ),
             },
         },
     )
@@ -55,6 +55,25 @@ class TestPrivateComputationGameRepository(unittest.TestCase):
         )
         self.assertEqual(attribution_game_config.arguments, expected_arguments)
 
+    def test_get_game_returns_cached_config(self) -> None:
+        self.assertEqual({}, self.game_repository._game_configs)
+        game_config = self.game_repository.get_game("attribution_compute_dev")
+
+        self.assertIs(
+            game_config, self.game_repository.get_game("attribution_compute_dev")
+        )
+
+    def test_onedocker_argument_is_hashable(self) -> None:
+        self.assertEqual(
+            1,
+            len(
+                {
+                    OneDockerArgument(name="input_path", required=True),
+                    OneDockerArgument(name="input_path", required=True),
+                }
+            ),
+        )
+
     def test_unsupported_game(self) -> None:
         unsupported_game_name = "unsupported game"
         with self.assertRaisesRegex(
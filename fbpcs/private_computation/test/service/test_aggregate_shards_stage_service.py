@@ -238,7 +238,9 @@ class TestAggregateShardsStageService(IsolatedAsyncioTestCase):
             num_files_per_mpc_container=NUM_NEW_SHARDS_PER_FILE,
             status_updates=[],
             run_id=self.run_id,
-            pcs_features=pcs_features if pcs_features else {PCSFeature.PCS_DUMMY},
+            pcs_features=PCSFeature.to_bitmask(
+                pcs_features if pcs_features else {PCSFeature.PCS_DUMMY}
+            ),
             log_cost_bucket="test_log_cost_bucket",
             container_permission_id=self.container_permission_id,
         )
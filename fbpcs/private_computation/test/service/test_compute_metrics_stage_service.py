@@ -298,7 +298,7 @@ class TestComputeMetricsStageService(IsolatedAsyncioTestCase):
             num_mpc_containers=2,
             num_files_per_mpc_container=NUM_NEW_SHARDS_PER_FILE,
             status_updates=[],
-            pcs_features=pcs_features,
+            pcs_features=PCSFeature.to_bitmask(pcs_features),
             run_id=self.run_id,
             container_permission_id=self.container_permission_id,
         )
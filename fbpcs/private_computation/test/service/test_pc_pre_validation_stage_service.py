@@ -63,7 +63,9 @@ class TestPCPreValidationStageService(IsolatedAsyncioTestCase):
             num_pid_containers=1,
             num_mpc_containers=1,
             num_files_per_mpc_container=1,
-            pcs_features=pcs_features if pcs_features else {PCSFeature.UNKNOWN},
+            pcs_features=PCSFeature.to_bitmask(
+                pcs_features if pcs_features else {PCSFeature.UNKNOWN}
+            ),
             status_updates=[],
             container_permission_id=self.container_permission_id,
         )
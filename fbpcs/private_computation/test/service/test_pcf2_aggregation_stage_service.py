@@ -241,7 +241,7 @@ class TestPCF2AggregationStageService(IsolatedAsyncioTestCase):
             status_updates=[],
             run_id=self.run_id,
             log_cost_bucket="test_log_cost_bucket",
-            pcs_features=pcs_features,
+            pcs_features=PCSFeature.to_bitmask(pcs_features),
             container_permission_id=self.container_permission_id,
         )
         common: CommonProductConfig = CommonProductConfig(
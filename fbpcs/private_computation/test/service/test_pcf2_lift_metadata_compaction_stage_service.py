@@ -167,7 +167,9 @@ class TestPCF2LiftMetadataCompactionStageService(IsolatedAsyncioTestCase):
             num_mpc_containers=4,
             num_files_per_mpc_container=NUM_NEW_SHARDS_PER_FILE,
             status_updates=[],
-            pcs_features={PCSFeature.PRIVATE_LIFT_UNIFIED_DATA_PROCESS},
+            pcs_features=PCSFeature.to_bitmask(
+                {PCSFeature.PRIVATE_LIFT_UNIFIED_DATA_PROCESS}
+            ),
             log_cost_bucket="test_log_cost_bucket",
             container_permission_id=self.container_permission_id,
         )
@@ -316,6 +316,32 @@ class TestPCF2LiftStageService(IsolatedAsyncioTestCase):
             ),
         )
 
+    def test_get_game_args_with_udp(self) -> None:
+        private_computation_instance = self._create_pc_instance(
+            pcs_features={PCSFeature.PRIVATE_LIFT_UNIFIED_DATA_PROCESS}
+        )
+        private_computation_instance.infra_config.num_lift_containers = 3
+        private_computation_instance.infra_config.num_secure_random_shards = 8
+        metadata_compaction_output_base_path = (
+            private_computation_instance.pcf2_lift_metadata_compaction_output_base_path
+        )
+
+        game_args = self.stage_svc.get_game_args(private_computation_instance, "", "")
+
+        self.assertEqual(
+            [(0, 3), (3, 3), (6, 2)],
+            [(arg["file_start_index"], arg["num_files"]) for arg in game_args],
+        )
+        for shard, arg in enumerate(game_args):
+            self.assertEqual(
+                f"{metadata_compaction_output_base_path}_secret_shares",
+                arg["input_base_path"],
+            )
+            self.assertEqual(
+                f"{metadata_compaction_output_base_path}_global_params_{shard}",
+                arg["input_global_params_path"],
+            )
+
     def _create_pc_instance(
         self, pcs_features: Set[PCSFeature]
     ) -> PrivateComputationInstance:
@@ -332,7 +358,7 @@ class TestPCF2LiftStageService(IsolatedAsyncioTestCase):
             status_updates=[],
             run_id=self.run_id,
             log_cost_bucket="test_log_cost_bucket",
-            pcs_features=pcs_features,
+            pcs_features=PCSFeature.to_bitmask(pcs_features),
             container_permission_id=self.container_permission_id,
         )
         common: CommonProductConfig = CommonProductConfig(
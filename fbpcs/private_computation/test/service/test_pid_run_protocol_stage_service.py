@@ -354,6 +354,35 @@ class TestPIDRunProtocolStageService(IsolatedAsyncioTestCase):
                     run_id=test_run_id,
                 )
 
+    def test_get_server_hostnames(self) -> None:
+        hostnames = ["node0.meta.com", "node1.meta.com"]
+        ips = ["192.0.2.0", "192.0.2.1"]
+        self.assertIsNone(
+            PIDRunProtocolStageService.get_server_hostnames(
+                PrivateComputationRole.PUBLISHER, ips, hostnames, 2, True
+            )
+        )
+        self.assertEqual(
+            ["https://node0.meta.com", "https://node1.meta.com"],
+            PIDRunProtocolStageService.get_server_hostnames(
+                PrivateComputationRole.PARTNER, ips, hostnames, 2, True
+            ),
+        )
+        self.assertEqual(
+            ["http://192.0.2.0", "http://192.0.2.1"],
+            PIDRunProtocolStageService.get_server_hostnames(
+                PrivateComputationRole.PARTNER, ips, hostnames, 2, False
+            ),
+        )
+        with self.assertRaisesRegex(ValueError, "missing server_hostnames"):
+            PIDRunProtocolStageService.get_server_hostnames(
+                PrivateComputationRole.PARTNER, ips, None, 2, True
+            )
+        with self.assertRaisesRegex(ValueError, "Supplied 2 server_ips"):
+            PIDRunProtocolStageService.get_server_hostnames(
+                PrivateComputationRole.PARTNER, ips, hostnames, 3, False
+            )
+
     def create_sample_pc_instance(
         self,
         pc_role: PrivateComputationRole = PrivateComputationRole.PARTNER,
@@ -378,7 +407,9 @@ class TestPIDRunProtocolStageService(IsolatedAsyncioTestCase):
             status_updates=[],
             run_id=run_id,
             server_domain=server_domain,
-            pcs_features=set() if not use_tls else {PCSFeature.PCF_TLS},
+            pcs_features=PCSFeature.to_bitmask(
+                set() if not use_tls else {PCSFeature.PCF_TLS}
+            ),
             container_permission_id=self.container_permission_id,
         )
         common: CommonProductConfig = CommonProductConfig(
@@ -693,9 +693,9 @@ class TestPrivateComputationService(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(None, instance.get_next_runnable_stage())
 
     @mock.patch(
-        "fbpcs.private_computation.service.private_computation.PrivateComputationService.run_stage_async"
+        "fbpcs.private_computation.service.private_computation.PrivateComputationService._run_validated_stage_async"
     )
-    def test_run_next(self, mock_run_stage_async) -> None:
+    def test_run_next(self, mock_run_validated_stage_async) -> None:
         flow = PrivateComputationStageFlow
         # pyre-fixme[16]: `Optional` has no attribute `completed_status`.
         status = flow.ID_MATCH.previous_stage.completed_status
@@ -706,8 +706,12 @@ class TestPrivateComputationService(unittest.IsolatedAsyncioTestCase):
             return_value=instance
         )
         self.private_computation_service.run_next(instance.infra_config.instance_id)
-        mock_run_stage_async.assert_called_with(
-            instance.infra_config.instance_id,
+        # the instance is read once and handed to the stage without another read
+        self.private_computation_service.instance_repository.read.assert_called_once_with(
+            instance_id=instance.infra_config.instance_id
+        )
+        mock_run_validated_stage_async.assert_called_with(
+            instance,
             flow.ID_MATCH,
             server_ips=None,
             ca_certificate=None,
@@ -715,9 +719,11 @@ class TestPrivateComputationService(unittest.IsolatedAsyncioTestCase):
         )
 
     @mock.patch(
-        "fbpcs.private_computation.service.private_computation.PrivateComputationService.run_stage_async"
+        "fbpcs.private_computation.service.private_computation.PrivateComputationService._run_validated_stage_async"
     )
-    def test_run_next_ignore_stage_flow_completed(self, mock_run_stage_async) -> None:
+    def test_run_next_ignore_stage_flow_completed(
+        self, mock_run_validated_stage_async
+    ) -> None:
         flow = PrivateComputationStageFlow
         status = flow.get_last_stage().completed_status
 
@@ -726,7 +732,7 @@ class TestPrivateComputationService(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(PrivateComputationServiceInvalidStageError):
             self.private_computation_service.run_next(instance.infra_config.instance_id)
 
-        mock_run_stage_async.assert_not_called()
+        mock_run_validated_stage_async.assert_not_called()
 
     def test_run_stage_correct_stage_order(
         self,
@@ -1233,6 +1239,15 @@ class TestPrivateComputationService(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(NotImplementedError):
             DummyStageFlow.STAGE_1.get_default_stage_service(args)
 
+    def test_stage_service_reused(self) -> None:
+        stage = PrivateComputationPCF2StageFlow.PCF2_ATTRIBUTION
+        stage_svc = self.private_computation_service._get_stage_service(stage)
+
+        self.assertIsInstance(stage_svc, PCF2AttributionStageService)
+        self.assertIs(
+            stage_svc, self.private_computation_service._get_stage_service(stage)
+        )
+
     def test_get_stage_service(self) -> None:
         """
         Test for get_stage_service method in stage flow classes
@@ -1431,7 +1446,7 @@ class TestPrivateComputationService(unittest.IsolatedAsyncioTestCase):
             mpc_compute_concurrency=self.test_concurrency,
             status_updates=status_updates or [],
             log_cost_bucket=self.log_cost_bucket,
-            pcs_features=pcs_features,
+            pcs_features=PCSFeature.to_bitmask(pcs_features),
             server_key_ref=server_key_ref,
             pce_config=pce_config,
         )
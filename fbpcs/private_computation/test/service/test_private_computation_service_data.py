@@ -0,0 +1,39 @@
+#!/usr/bin/env fbpython
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-unsafe
+
+from unittest import TestCase
+
+from fbpcs.private_computation.entity.infra_config import PrivateComputationGameType
+from fbpcs.private_computation.service.private_computation_service_data import (
+    PrivateComputationServiceData,
+)
+
+
+class TestPrivateComputationServiceData(TestCase):
+    def test_get(self) -> None:
+        service_data = PrivateComputationServiceData.get(
+            PrivateComputationGameType.LIFT
+        )
+
+        self.assertIs(
+            PrivateComputationServiceData.LIFT_COMBINER_STAGE_DATA,
+            service_data.combiner_stage,
+        )
+        self.assertIs(
+            PrivateComputationServiceData.LIFT_COMPUTE_STAGE_DATA,
+            service_data.compute_stage,
+        )
+        # the stage data is built once per game type
+        self.assertIs(
+            service_data,
+            PrivateComputationServiceData.get(PrivateComputationGameType.LIFT),
+        )
+        self.assertIsNot(
+            service_data,
+            PrivateComputationServiceData.get(PrivateComputationGameType.ATTRIBUTION),
+        )
@@ -120,7 +120,7 @@ class TestPrivateIdDfcaAggregateStageService(IsolatedAsyncioTestCase):
             num_files_per_mpc_container=NUM_NEW_SHARDS_PER_FILE,
             status_updates=[],
             run_id=self.run_id,
-            pcs_features={PCSFeature.PCS_DUMMY},
+            pcs_features=PCSFeature.to_bitmask({PCSFeature.PCS_DUMMY}),
             container_permission_id=self.container_permission_id,
         )
         common: CommonProductConfig = CommonProductConfig(
@@ -6,6 +6,7 @@
 
 # pyre-unsafe
 
+import threading
 from unittest import IsolatedAsyncioTestCase, mock
 from unittest.mock import patch
 
@@ -108,6 +109,33 @@ class TestRunBinaryBaseService(IsolatedAsyncioTestCase):
         self.assertEqual(updated_containers[0], container_1_complete)
         self.assertEqual(updated_containers[1], container_2_fail)
 
+    @mock.patch("fbpcp.service.onedocker.OneDockerService.start_containers")
+    async def test_start_containers_off_event_loop(self, start_containers) -> None:
+        container = ContainerInstance(
+            "arn:aws:ecs:region:account_id:task/container_id_1",
+            "192.0.2.0",
+            ContainerInstanceStatus.STARTED,
+        )
+        start_containers_threads = []
+
+        def _start_containers(**kwargs):
+            start_containers_threads.append(threading.get_ident())
+            return [container]
+
+        start_containers.side_effect = _start_containers
+
+        containers = await RunBinaryBaseService().start_containers(
+            cmd_args_list=["--arg=1"],
+            onedocker_svc=self.onedocker_svc,
+            binary_version="latest",
+            binary_name="binary",
+            wait_for_containers_to_start_up=False,
+        )
+
+        self.assertEqual([container], containers)
+        start_containers.assert_called_once()
+        self.assertNotEqual([threading.get_ident()], start_containers_threads)
+
     def test_get_containers_to_start_no_existing_containers(self) -> None:
         for num_containers in range(2):
             with self.subTest(num_containers=num_containers):
@@ -411,7 +411,7 @@ class TestSecureRandomShardingStageService(IsolatedAsyncioTestCase):
             num_files_per_mpc_container=NUM_NEW_SHARDS_PER_FILE,
             status_updates=[],
             log_cost_bucket="test_log_cost_bucket",
-            pcs_features=pcs_features if pcs_features else set(),
+            pcs_features=PCSFeature.to_bitmask(pcs_features if pcs_features else set()),
             container_permission_id=self.container_permission_id,
         )
 
@@ -82,6 +82,28 @@ class TestShardStageService(IsolatedAsyncioTestCase):
                 permission=ContainerPermissionConfig(self.container_permission_id),
             )
 
+    async def test_reshard_num_output_files(self) -> None:
+        private_computation_instance = self.create_sample_instance()
+        private_computation_instance.infra_config.num_pid_containers = 3
+        private_computation_instance.infra_config.num_mpc_containers = 7
+        private_computation_instance.infra_config.num_files_per_mpc_container = 27
+
+        with patch.object(ShardingService, "start_containers") as mock_shard:
+            await self.stage_svc.run_async(
+                private_computation_instance,
+                NullCertificateProvider(),
+                NullCertificateProvider(),
+                "",
+                "",
+            )
+
+        # 7 * 27 / 3 == 63 exactly, which (7 / 3) * 27 overshoots in floating point
+        cmd_args_list = mock_shard.call_args.kwargs["cmd_args_list"]
+        self.assertEqual(3, len(cmd_args_list))
+        for shard_index, cmd_args in enumerate(cmd_args_list):
+            self.assertIn(f"--file_start_index={shard_index * 63}", cmd_args)
+            self.assertIn("--num_output_files=63", cmd_args)
+
     def create_sample_instance(self) -> PrivateComputationInstance:
         infra_config: InfraConfig = InfraConfig(
             instance_id="test_instance_123",
@@ -212,6 +212,8 @@ class TestUtils(IsolatedAsyncioTestCase):
 
         # Assert
         self.assertEqual(result, expected_result)
+        server_certificate_provider.get_certificate.assert_called_once()
+        ca_certificate_provider.get_certificate.assert_called_once()
         with self.assertRaises(ValueError) as e:
             generate_env_vars_dicts_list(
                 num_containers=num_containers,
@@ -229,6 +231,24 @@ class TestUtils(IsolatedAsyncioTestCase):
                 str(e.exception),
             )
 
+    def test_generate_env_vars_dicts_list_kwargs(self) -> None:
+        # Act
+        result = generate_env_vars_dicts_list(
+            num_containers=2,
+            repository_path="test_path/",
+            server_ip_addresses=["192.0.2.0", "192.0.2.1"],
+            server_hostnames=["node0.test.com", "node1.test.com"],
+            RUST_LOG="info",
+            UNSET_VAR=None,
+        )
+
+        # Assert
+        self.assertEqual(len(result), 2)
+        for env_vars in result:
+            self.assertEqual(env_vars["RUST_LOG"], "info")
+            self.assertNotIn("UNSET_VAR", env_vars)
+        self.assertIsNot(result[0], result[1])
+
     def test_generate_env_vars_null_server_key_ref(self) -> None:
         # Arrange
 